@@ -0,0 +1,90 @@
+"""Benchmark the Length probing tiers against the old mutagen path.
+
+Usage: python benchmark_probe.py <file or folder> [...]
+
+For every .mp3/.flac/.wav found it times the old approach (instantiating
+MP3/FLAC/WAVE and reading audio.info.length), the header-only fast tier and
+the exact tier, and reports the largest difference from the old lengths.
+"""
+import os
+import sys
+import time
+from collections import defaultdict
+
+from mutagen.mp3 import MP3
+from mutagen.flac import FLAC
+from mutagen.wave import WAVE
+
+from tuneincrew_xml_generator import probe_duration_fast, probe_duration_exact
+
+AUDIO_TYPES = {'.mp3': MP3, '.flac': FLAC, '.wav': WAVE}
+
+def find_audio_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in AUDIO_TYPES:
+                        yield os.path.join(folder, name)
+        elif os.path.splitext(path)[1].lower() in AUDIO_TYPES:
+            yield path
+
+def timed(func, *args):
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as e:
+        result = e
+    return result, time.perf_counter() - start
+
+def mutagen_length(file_path):
+    audio_type = AUDIO_TYPES[os.path.splitext(file_path)[1].lower()]
+    return audio_type(file_path).info.length
+
+def main(paths):
+    stats = defaultdict(lambda: defaultdict(float))
+    for file_path in find_audio_files(paths):
+        ext = os.path.splitext(file_path)[1].lower()
+        row = stats[ext]
+        row['files'] += 1
+
+        old, row_time = timed(mutagen_length, file_path)
+        row['mutagen'] += row_time
+        fast, row_time = timed(probe_duration_fast, file_path)
+        row['fast'] += row_time
+        exact, row_time = timed(probe_duration_exact, file_path)
+        row['exact'] += row_time
+
+        if isinstance(fast, Exception):
+            row['fast errors'] += 1
+            fast = None
+        elif not fast[1]:
+            row['low confidence'] += 1
+        if isinstance(exact, Exception):
+            row['exact errors'] += 1
+            exact = None
+        if isinstance(old, Exception):
+            continue
+        if fast is not None:
+            row['fast max diff'] = max(row['fast max diff'], abs(fast[0] - old))
+        if exact is not None:
+            row['exact max diff'] = max(row['exact max diff'], abs(exact - old))
+
+    if not stats:
+        print("No .mp3/.flac/.wav files found")
+        return
+
+    print(f"{'type':6}{'files':>7}{'mutagen ms':>12}{'fast ms':>10}{'exact ms':>10}"
+          f"{'low conf':>10}{'fast diff s':>13}{'exact diff s':>14}")
+    for ext, row in sorted(stats.items()):
+        print(f"{ext:6}{int(row['files']):>7}{row['mutagen'] * 1000:>12.1f}{row['fast'] * 1000:>10.1f}"
+              f"{row['exact'] * 1000:>10.1f}{int(row['low confidence']):>10}"
+              f"{row['fast max diff']:>13.2f}{row['exact max diff']:>14.2f}")
+        if row['fast errors'] or row['exact errors']:
+            print(f"      errors: fast {int(row['fast errors'])}, exact {int(row['exact errors'])}")
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(sys.argv[1:])
@@ -1,16 +1,651 @@
 import sys
 import os
+import math
+import mmap
+import re
+import struct
+import time
 import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QLineEdit, QPushButton, QFileDialog, QScrollArea, 
                              QMessageBox, QGroupBox, QSpacerItem, QSizePolicy, QCheckBox,
-                             QDockWidget)
-from PyQt5.QtCore import Qt, QProcess, QSettings, QMimeData
+                             QDockWidget, QComboBox)
+from PyQt5.QtCore import Qt, QProcess, QSettings, QMimeData, QTimer, QThread, QFileSystemWatcher
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent
 import mutagen
-from mutagen.mp3 import MP3
+from mutagen.id3 import ID3, ID3NoHeaderError
 from mutagen.flac import FLAC
 from mutagen.wave import WAVE
+import numpy as np
+
+# Audio analysis settings
+ANALYSIS_CHUNK_FRAMES = 1 << 18  # frames per NumPy view, keeps memory flat for long files
+ANALYSIS_SILENCE_DBFS = -60.0  # anything quieter than this counts as silence
+ANALYSIS_CLIP_LEVEL = 0.999  # normalized sample magnitude treated as full scale
+ANALYSIS_MAX_CLIPPED_SAMPLES = 10
+ANALYSIS_QUIET_RMS_DBFS = -40.0
+ANALYSIS_MAX_EDGE_SILENCE = 2.0  # seconds of leading/trailing silence allowed
+
+def to_dbfs(value):
+    """Convert a normalized amplitude to dBFS"""
+    if value <= 0:
+        return float('-inf')
+    return 20 * math.log10(value)
+
+def read_wav_header(file_path):
+    """Locate the fmt and data chunks of a RIFF/WAVE file without reading samples"""
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] not in (b'RIFF', b'RF64') or header[8:12] != b'WAVE':
+            raise ValueError("Not a RIFF/WAVE file")
+        file_size = os.fstat(f.fileno()).st_size
+        info = None
+
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id = chunk_header[:4]
+            chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+
+            if chunk_id == b'fmt ':
+                fmt_data = f.read(chunk_size)
+                if len(fmt_data) < 16:
+                    raise ValueError("Truncated fmt chunk")
+                format_tag, channels, sample_rate, byte_rate, block_align, bits = struct.unpack('<HHIIHH', fmt_data[:16])
+                # WAVE_FORMAT_EXTENSIBLE keeps the real format in the sub-format GUID
+                if format_tag == 0xFFFE and len(fmt_data) >= 26:
+                    format_tag = struct.unpack('<H', fmt_data[24:26])[0]
+                info = {
+                    'format_tag': format_tag,
+                    'channels': channels,
+                    'sample_rate': sample_rate,
+                    'byte_rate': byte_rate,
+                    'block_align': block_align,
+                    'bits_per_sample': bits,
+                }
+                if chunk_size % 2:
+                    f.seek(1, 1)
+            elif chunk_id == b'data':
+                if info is None:
+                    raise ValueError("data chunk before fmt chunk")
+                info['data_offset'] = f.tell()
+                # Streamed or truncated files may claim more data than exists
+                info['data_size'] = min(chunk_size, file_size - info['data_offset'])
+                return info
+            else:
+                f.seek(chunk_size + (chunk_size % 2), 1)
+
+    raise ValueError("No data chunk found")
+
+def _pcm_view(file_path, header):
+    """Memory-map the data chunk and return (samples, converter to float32, clip level)"""
+    channels = header['channels']
+    block_align = header['block_align']
+    if not channels or not block_align or block_align % channels:
+        raise ValueError("Invalid WAV block alignment")
+    sample_width = block_align // channels
+    frames = header['data_size'] // block_align
+    format_tag = header['format_tag']
+
+    if format_tag == 3 and sample_width in (4, 8):
+        dtype, shape = ('<f4' if sample_width == 4 else '<f8'), (frames, channels)
+        convert = lambda block: block.astype(np.float32)
+    elif format_tag == 1 and sample_width == 1:
+        dtype, shape = 'u1', (frames, channels)
+        convert = lambda block: (block.astype(np.float32) - 128.0) * (1.0 / 128)
+    elif format_tag == 1 and sample_width == 2:
+        dtype, shape = '<i2', (frames, channels)
+        convert = lambda block: block.astype(np.float32) * (1.0 / 32768)
+    elif format_tag == 1 and sample_width == 3:
+        dtype, shape = 'u1', (frames, channels, 3)
+        def convert(block):
+            b = block.astype(np.int32)
+            value = b[..., 0] | (b[..., 1] << 8) | (b[..., 2] << 16)
+            value = (value ^ 0x800000) - 0x800000  # sign-extend 24-bit
+            return value.astype(np.float32) * (1.0 / 8388608)
+    elif format_tag == 1 and sample_width == 4:
+        dtype, shape = '<i4', (frames, channels)
+        convert = lambda block: block.astype(np.float32) * (1.0 / 2147483648)
+    else:
+        raise ValueError(f"Unsupported WAV format (tag {format_tag}, {sample_width * 8}-bit)")
+
+    # Integer formats top out one code below +1.0 (127/128 for 8-bit), so the
+    # largest positive code must count as clipped too
+    clip_level = ANALYSIS_CLIP_LEVEL
+    if format_tag == 1:
+        scale = 1 << (sample_width * 8 - 1)
+        clip_level = min(clip_level, (scale - 1.5) / scale)
+
+    if frames == 0:
+        return None, convert, clip_level
+    samples = np.memmap(file_path, dtype=dtype, mode='r', offset=header['data_offset'], shape=shape)
+    return samples, convert, clip_level
+
+def analyze_wav(file_path, chunk_frames=ANALYSIS_CHUNK_FRAMES):
+    """Compute peak, RMS and leading/trailing silence of a WAV file chunk by chunk"""
+    header = read_wav_header(file_path)
+    sample_rate = header['sample_rate']
+    if not sample_rate:
+        raise ValueError("Invalid WAV sample rate")
+    samples, convert, clip_level = _pcm_view(file_path, header)
+    frames = 0 if samples is None else samples.shape[0]
+
+    silence_level = 10 ** (ANALYSIS_SILENCE_DBFS / 20)
+    peak = 0.0
+    sum_squares = 0.0
+    clipped = 0
+    first_loud = None
+    last_loud = None
+
+    for start in range(0, frames, chunk_frames):
+        block = convert(samples[start:start + chunk_frames])
+        magnitude = np.abs(block)
+        frame_peak = magnitude.max(axis=1)
+        peak = max(peak, float(frame_peak.max()))
+        sum_squares += float(np.square(block, dtype=np.float64).sum())
+        clipped += int(np.count_nonzero(magnitude >= clip_level))
+
+        loud = np.flatnonzero(frame_peak > silence_level)
+        if loud.size:
+            if first_loud is None:
+                first_loud = start + int(loud[0])
+            last_loud = start + int(loud[-1])
+    del samples  # release the memory map
+
+    duration = frames / sample_rate
+    rms = math.sqrt(sum_squares / (frames * header['channels'])) if frames else 0.0
+    if first_loud is None:
+        leading = trailing = duration
+    else:
+        leading = first_loud / sample_rate
+        trailing = (frames - 1 - last_loud) / sample_rate
+
+    return {
+        'duration': duration,
+        'peak_dbfs': to_dbfs(peak),
+        'rms_dbfs': to_dbfs(rms),
+        'clipped_samples': clipped,
+        'leading_silence': leading,
+        'trailing_silence': trailing,
+    }
+
+def analysis_issues(result):
+    """Return a list of human readable problems found by analyze_wav"""
+    if 'error' in result:
+        return [f"analysis failed: {result['error']}"]
+    issues = []
+    if result['clipped_samples'] > ANALYSIS_MAX_CLIPPED_SAMPLES:
+        issues.append(f"clipped ({result['clipped_samples']} samples at full scale)")
+    if result['rms_dbfs'] < ANALYSIS_QUIET_RMS_DBFS:
+        issues.append(f"nearly silent (RMS {result['rms_dbfs']:.1f} dBFS)")
+    if result['leading_silence'] > ANALYSIS_MAX_EDGE_SILENCE:
+        issues.append(f"{result['leading_silence']:.1f}s leading silence")
+    if result['trailing_silence'] > ANALYSIS_MAX_EDGE_SILENCE:
+        issues.append(f"{result['trailing_silence']:.1f}s trailing silence")
+    return issues
+
+def format_analysis(result):
+    """One-line summary of an analysis result for display"""
+    if 'error' in result:
+        return f"Analysis failed: {result['error']}"
+    text = (f"Peak {result['peak_dbfs']:.1f} dBFS | RMS {result['rms_dbfs']:.1f} dBFS | "
+            f"Silence {result['leading_silence']:.1f}s / {result['trailing_silence']:.1f}s")
+    issues = analysis_issues(result)
+    if issues:
+        text += " | " + ", ".join(issues)
+    return text
+
+# Duration probing settings
+MP3_SYNC_SEARCH_BYTES = 64 * 1024  # how far past the ID3 tag to look for the first frame
+MP3_CBR_CHECK_FRAMES = 16  # frames that must share a bitrate to trust a CBR estimate
+MP3_CBR_SAMPLE_POINTS = (0.25, 0.5, 0.75, 0.95)  # positions in the stream checked as well
+
+# Bitrates in kbps by (MPEG-1, layer)
+MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by version bits (0: MPEG-2.5, 2: MPEG-2, 3: MPEG-1)
+MP3_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+def format_length(seconds):
+    """Format a duration in seconds as min:sec"""
+    minutes = int(seconds // 60)
+    seconds = int(seconds % 60)
+    return f"{minutes}:{seconds:02d}"
+
+def id3v2_end(data):
+    """Offset of the first byte after any ID3v2 tags at the start of data"""
+    offset = 0
+    while data[offset:offset + 3] == b'ID3' and len(data) >= offset + 10:
+        size = 0
+        for byte in data[offset + 6:offset + 10]:
+            size = (size << 7) | (byte & 0x7F)  # syncsafe integer
+        footer = 10 if data[offset + 5] & 0x10 else 0
+        offset += 10 + size + footer
+    return offset
+
+def parse_mp3_frame_header(data, offset):
+    """Decode the MPEG audio frame header at offset, or return None if there is none"""
+    if offset + 4 > len(data) or data[offset] != 0xFF or (data[offset + 1] & 0xE0) != 0xE0:
+        return None
+    b1 = data[offset + 1]
+    b2 = data[offset + 2]
+    version_bits = (b1 >> 3) & 3
+    layer_bits = (b1 >> 1) & 3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    # Reserved values, and free-format streams which have no usable bitrate
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version_bits][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (mpeg1 or layer == 2) else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return {
+        'mpeg1': mpeg1,
+        'layer': layer,
+        'mono': (data[offset + 3] >> 6) == 3,
+        'bitrate': bitrate,
+        'sample_rate': sample_rate,
+        'samples': samples,
+        'length': length,
+    }
+
+def find_mp3_frame(data, start, end):
+    """Find the first frame header in data[start:end] that is followed by another one"""
+    offset = data.find(b'\xff', start, end)
+    while offset != -1:
+        frame = parse_mp3_frame_header(data, offset)
+        if frame:
+            next_offset = offset + frame['length']
+            if next_offset + 4 > len(data) or parse_mp3_frame_header(data, next_offset):
+                return offset, frame
+        offset = data.find(b'\xff', offset + 1, end)
+    return None, None
+
+def mp3_vbr_frame_count(data, offset, frame):
+    """Frame count from a Xing/Info or VBRI header in the first frame, if present"""
+    if frame['layer'] == 3:
+        if frame['mpeg1']:
+            side_info = 17 if frame['mono'] else 32
+        else:
+            side_info = 9 if frame['mono'] else 17
+        xing = offset + 4 + side_info
+        if data[xing:xing + 4] in (b'Xing', b'Info'):
+            flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+            if flags & 1:
+                return struct.unpack('>I', data[xing + 8:xing + 12])[0]
+            return None
+    vbri = offset + 4 + 32
+    if data[vbri:vbri + 4] == b'VBRI':
+        return struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+    return None
+
+def mp3_audio_end(data):
+    """End of the MPEG audio stream, excluding a trailing ID3v1 tag"""
+    if len(data) >= 128 and data[-128:-125] == b'TAG':
+        return len(data) - 128
+    return len(data)
+
+def probe_mp3_fast(data):
+    audio_start = id3v2_end(data)
+    offset, frame = find_mp3_frame(data, audio_start, min(len(data), audio_start + MP3_SYNC_SEARCH_BYTES))
+    if frame is None:
+        raise ValueError("No MPEG audio frame found")
+
+    frame_count = mp3_vbr_frame_count(data, offset, frame)
+    if frame_count:
+        return frame_count * frame['samples'] / frame['sample_rate'], True
+
+    # No VBR header: estimate from the bitrate, trusted only if frames at the start
+    # and spread across the rest of the stream all agree on it
+    audio_end = mp3_audio_end(data)
+    duration = (audio_end - offset) * 8 / frame['bitrate']
+    position = offset
+    for _ in range(MP3_CBR_CHECK_FRAMES):
+        current = parse_mp3_frame_header(data, position)
+        if current is None:
+            return duration, position >= audio_end
+        if current['bitrate'] != frame['bitrate']:
+            return duration, False
+        position += current['length']
+
+    if position >= audio_end:
+        return duration, True
+    for point in MP3_CBR_SAMPLE_POINTS:
+        start = offset + int((audio_end - offset) * point)
+        _, current = find_mp3_frame(data, start, min(audio_end, start + MP3_SYNC_SEARCH_BYTES))
+        if current is None or current['bitrate'] != frame['bitrate']:
+            return duration, False
+    return duration, True
+
+def probe_mp3_exact(data):
+    """Count every frame in the stream"""
+    audio_start = id3v2_end(data)
+    audio_end = mp3_audio_end(data)
+    offset, frame = find_mp3_frame(data, audio_start, min(audio_end, audio_start + MP3_SYNC_SEARCH_BYTES))
+    if frame is None:
+        raise ValueError("No MPEG audio frame found")
+    sample_rate = frame['sample_rate']
+
+    # The Xing/Info/VBRI frame carries no audio
+    if mp3_vbr_frame_count(data, offset, frame) is not None:
+        offset += frame['length']
+
+    samples = 0
+    while offset + 4 <= audio_end:
+        frame = parse_mp3_frame_header(data, offset)
+        if frame is None:
+            # Lost sync (junk or a broken frame), look for the next real frame
+            offset, frame = find_mp3_frame(data, offset + 1, min(audio_end, offset + MP3_SYNC_SEARCH_BYTES))
+            if frame is None:
+                break
+        samples += frame['samples']
+        offset += frame['length']
+    return samples / sample_rate
+
+def probe_flac_fast(data):
+    offset = id3v2_end(data)
+    if data[offset:offset + 4] != b'fLaC':
+        raise ValueError("Not a FLAC file")
+    block = offset + 4
+    if data[block] & 0x7F != 0:
+        raise ValueError("FLAC STREAMINFO block missing")
+    info = data[block + 4:block + 4 + 34]
+    sample_rate = (info[10] << 12) | (info[11] << 4) | (info[12] >> 4)
+    total_samples = ((info[13] & 0x0F) << 32) | struct.unpack('>I', info[14:18])[0]
+    if not sample_rate:
+        raise ValueError("Invalid FLAC sample rate")
+    # Encoders that stream may leave the sample count unknown (zero)
+    return total_samples / sample_rate, total_samples > 0
+
+def probe_wav_fast(file_path):
+    header = read_wav_header(file_path)
+    if not header['byte_rate'] or not header['block_align']:
+        raise ValueError("Invalid WAV header")
+    if header['format_tag'] in (1, 3) and header['sample_rate']:
+        frames = header['data_size'] // header['block_align']
+        return frames / header['sample_rate'], True
+    # Compressed WAV: byte rate is only an average
+    return header['data_size'] / header['byte_rate'], False
+
+def probe_duration_fast(file_path):
+    """Read the duration from headers only. Returns (seconds, confident)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.wav':
+        return probe_wav_fast(file_path)
+    if ext not in ('.mp3', '.flac'):
+        raise ValueError(f"Unsupported audio format: {ext}")
+    # mmap only pages in what is touched: the header region and a few frames
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if ext == '.mp3':
+            return probe_mp3_fast(data)
+        return probe_flac_fast(data)
+
+def probe_duration_exact(file_path):
+    """Slow but exact duration: MP3 frames are counted, other formats go through mutagen.
+    Returns None when the length is unknown (e.g. FLAC with no total sample count)."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.mp3':
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            length = probe_mp3_exact(data)
+    elif ext == '.flac':
+        length = FLAC(file_path).info.length
+    elif ext == '.wav':
+        length = WAVE(file_path).info.length
+    else:
+        raise ValueError(f"Unsupported audio format: {ext}")
+    return length if length > 0 else None
+
+def probe_duration(file_path, exact=False):
+    """Duration in seconds (or None), using the exact tier only when asked or when
+    the header-only tier is not confident"""
+    fast = None
+    if not exact:
+        try:
+            fast = probe_duration_fast(file_path)
+        except (OSError, ValueError, IndexError, struct.error) as e:
+            print(f"Fast duration probe failed: {e}")
+        if fast is not None and fast[1]:
+            return fast[0]
+    try:
+        return probe_duration_exact(file_path)
+    except Exception as e:
+        print(f"Exact duration probe failed: {e}")
+        return fast[0] if fast is not None else None
+
+def read_audio_tags(file_path):
+    """Load only the tags of an audio file (None if it has none)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.mp3':
+        try:
+            return ID3(file_path)
+        except ID3NoHeaderError:
+            return None
+    if ext == '.flac':
+        return FLAC(file_path).tags
+    if ext == '.wav':
+        return WAVE(file_path).tags
+    return None
+
+# Song fields as (XML tag, SongWidget attribute, label)
+SONG_FIELDS = [
+    ('file', 'song_file_edit', 'Music File'),
+    ('name', 'song_name_edit', 'Song Name'),
+    ('artist', 'song_artist_edit', 'Artist'),
+    ('year', 'song_year_edit', 'Year'),
+    ('length', 'song_length_edit', 'Length'),
+    ('force', 'song_force_edit', 'Force'),
+]
+
+# Immutable copy of everything written to the station XML.
+# jingles is a tuple of file paths, songs a tuple of value tuples ordered like SONG_FIELDS.
+StationSnapshot = namedtuple('StationSnapshot', ['fmod', 'id', 'name', 'logo', 'jingles', 'songs'])
+
+def escape_xml_text(text):
+    """Escape special XML characters"""
+    if not text:
+        return text
+        
+    # Replace special characters with their XML entities
+    text = text.replace("&", "&amp;")
+    text = text.replace("<", "&lt;")
+    text = text.replace(">", "&gt;")
+    text = text.replace('"', "&quot;")
+    text = text.replace("'", "&apos;")
+    
+    return text
+
+def pretty_write(file, elem, level=0):
+    """Recursively write XML with proper indentation"""
+    indent = "  " * level
+    if len(elem) == 0:  # No children
+        if elem.text and elem.text.strip():
+            file.write(f"{indent}<{elem.tag}>{elem.text}</{elem.tag}>\n".encode('utf-8'))
+        else:
+            file.write(f"{indent}<{elem.tag}></{elem.tag}>\n".encode('utf-8'))
+    else:
+        file.write(f"{indent}<{elem.tag}>\n".encode('utf-8'))
+        if elem.text and elem.text.strip():
+            file.write(f"{indent}  {elem.text}\n".encode('utf-8'))
+        
+        for child in elem:
+            pretty_write(file, child, level + 1)
+            
+        file.write(f"{indent}</{elem.tag}>\n".encode('utf-8'))
+
+def build_station_xml(snapshot):
+    """Build the project element tree for a StationSnapshot"""
+    # Create root element
+    root = ET.Element("project")
+    
+    # Add FMOD path
+    fmod_elem = ET.SubElement(root, "fmod")
+    fmod_elem.text = escape_xml_text(snapshot.fmod)
+    
+    # Add radio element with ID, name and logo
+    radio_elem = ET.SubElement(root, "radio")
+    for tag in ('id', 'name', 'logo'):
+        elem = ET.SubElement(radio_elem, tag)
+        elem.text = escape_xml_text(getattr(snapshot, tag))
+    
+    # Add jingles if any
+    if snapshot.jingles:
+        jingles_elem = ET.SubElement(radio_elem, "jingles")
+        for jingle in snapshot.jingles:
+            file_elem = ET.SubElement(jingles_elem, "file")
+            file_elem.text = escape_xml_text(jingle)
+    
+    # Add songs
+    songs_elem = ET.SubElement(radio_elem, "songs")
+    for song in snapshot.songs:
+        song_elem = ET.SubElement(songs_elem, "song")
+        for (tag, _, _), value in zip(SONG_FIELDS, song):
+            elem = ET.SubElement(song_elem, tag)
+            elem.text = escape_xml_text(value)
+    
+    return root
+
+def write_station_xml(file_path, snapshot):
+    """Serialize a StationSnapshot and replace file_path with it atomically"""
+    root = build_station_xml(snapshot)
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+            pretty_write(f, root, 0)
+        os.replace(temp_path, file_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def read_station_xml(file_path):
+    """Parse a station XML file into a StationSnapshot"""
+    root = ET.parse(file_path).getroot()
+    
+    def child_text(elem, tag, default=''):
+        child = elem.find(tag) if elem is not None else None
+        if child is None:
+            return default
+        return child.text or ''
+    
+    radio_elem = root.find('radio')
+    jingles = ()
+    songs = ()
+    if radio_elem is not None:
+        jingles_elem = radio_elem.find('jingles')
+        if jingles_elem is not None:
+            jingles = tuple(elem.text or '' for elem in jingles_elem.findall('file'))
+        songs_elem = radio_elem.find('songs')
+        if songs_elem is not None:
+            # A missing force keeps the SongWidget default of "0"
+            songs = tuple(
+                tuple(child_text(song_elem, tag, '0' if tag == 'force' else '') for tag, _, _ in SONG_FIELDS)
+                for song_elem in songs_elem.findall('song')
+            )
+    
+    return StationSnapshot(
+        fmod=child_text(root, 'fmod'),
+        id=child_text(radio_elem, 'id'),
+        name=child_text(radio_elem, 'name'),
+        logo=child_text(radio_elem, 'logo'),
+        jingles=jingles,
+        songs=songs,
+    )
+
+def match_songs(songs, other_songs):
+    """For each song, the index of the song with the same file path in other_songs
+    (or None). Duplicate paths are matched in order."""
+    by_path = {}
+    for index, song in enumerate(other_songs):
+        by_path.setdefault(song[0], []).append(index)
+    return [by_path[song[0]].pop(0) if by_path.get(song[0]) else None for song in songs]
+
+def diff_songs(current_songs, new_songs):
+    """Match song value tuples by file path.
+    
+    Returns (added songs, indices of removed current songs, [(current index, new song)]
+    for matched songs whose values changed). Duplicate paths are matched in order.
+    """
+    matches = match_songs(new_songs, current_songs)
+    added = [song for song, index in zip(new_songs, matches) if index is None]
+    modified = [(index, song) for song, index in zip(new_songs, matches)
+                if index is not None and current_songs[index] != song]
+    matched = set(index for index in matches if index is not None)
+    removed = [index for index in range(len(current_songs)) if index not in matched]
+    return added, removed, modified
+
+class LoadThread(QThread):
+    """Parses the station XML off the GUI thread"""
+    def __init__(self, file_path, stamp, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.stamp = stamp
+        self.snapshot = None
+        self.error = None
+        
+    def run(self):
+        try:
+            self.snapshot = read_station_xml(self.file_path)
+        except Exception as e:
+            self.error = str(e)
+
+class SaveThread(QThread):
+    """Writes one station snapshot off the GUI thread"""
+    def __init__(self, file_path, snapshot, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.snapshot = snapshot
+        self.error = None
+        
+    def run(self):
+        try:
+            write_station_xml(self.file_path, self.snapshot)
+        except Exception as e:
+            self.error = str(e)
+
+def normalize_year(text):
+    """Reduce dates like "2004-05-01" to "2004", leaving anything else untouched"""
+    match = re.match(r'\s*(\d{4})\b', text)
+    return match.group(1) if match else text
+
+def normalize_length(text):
+    """Rewrite lengths like "215", "3:5" or "1:02:03" as min:sec"""
+    parts = text.strip().split(':')
+    # Plain decimal numbers only, so "inf", "nan" or "1e400" are left as they are
+    if not 1 <= len(parts) <= 3 or not all(re.fullmatch(r'\d+(\.\d+)?', part) for part in parts):
+        return text
+    total = 0.0
+    for part in parts:
+        total = total * 60 + float(part)
+    if not math.isfinite(total):
+        return text
+    total = int(total)
+    return f"{total // 60}:{total % 60:02d}"
+
+def file_stamp(file_path):
+    """Cheap identity of a file's current contents (mtime, size)"""
+    stat = os.stat(file_path)
+    return (stat.st_mtime_ns, stat.st_size)
 
 class DragDropLineEdit(QLineEdit):
     def __init__(self, parent=None):
@@ -31,6 +666,16 @@ class DragDropLineEdit(QLineEdit):
                 if hasattr(self.parent(), 'handle_dropped_audio'):
                     self.parent().handle_dropped_audio(file_path, self)
 
+def show_analysis_label(label, result):
+    """Fill an analysis label, highlighting results that fail the pre-build checks"""
+    if result is None:
+        label.clear()
+        label.setVisible(False)
+        return
+    label.setText(format_analysis(result))
+    label.setStyleSheet("color: red;" if analysis_issues(result) else "")
+    label.setVisible(True)
+
 class SongWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -43,6 +688,9 @@ class SongWidget(QWidget):
         
         # File selection
         file_layout = QHBoxLayout()
+        self.select_check = QCheckBox()
+        self.select_check.setToolTip("Select for bulk edit")
+        file_layout.addWidget(self.select_check)
         self.song_file_edit = DragDropLineEdit(self)
         self.song_file_edit.textChanged.connect(self.on_file_changed)
         song_browse_btn = QPushButton("Browse")
@@ -94,12 +742,18 @@ class SongWidget(QWidget):
         
         self.song_layout.addLayout(details_layout)
         
+        # Audio analysis summary (filled in by "Analyze Audio")
+        self.analysis_label = QLabel()
+        self.analysis_label.setVisible(False)
+        self.song_layout.addWidget(self.analysis_label)
+        
         # Remove button
         self.remove_btn = QPushButton("Remove Song")
         self.song_layout.addWidget(self.remove_btn)
         
     def on_file_changed(self, text):
         """Handle when the file path changes"""
+        self.show_analysis(None)
         if text and os.path.exists(text) and text.lower().endswith(('.mp3', '.wav', '.flac')):
             self.extract_audio_metadata(text)
         
@@ -120,60 +774,64 @@ class SongWidget(QWidget):
         try:
             # Get file extension to determine the type
             ext = os.path.splitext(file_path)[1].lower()
-            
-            # Load the file based on its type
-            if ext == '.mp3':
-                audio = MP3(file_path)
-            elif ext == '.flac':
-                audio = FLAC(file_path)
-            elif ext == '.wav':
-                audio = WAVE(file_path)
-            else:
+            if ext not in ('.mp3', '.flac', '.wav'):
                 return  # Unsupported format
             
-            # Extract metadata with fallback for different tag formats
-            title = None
-            artist = None
-            date = None
-            
-            # Try different tag formats for title
-            for tag in ['TIT2', 'TITLE', 'Title', 'title']:
-                if tag in audio.tags:
-                    title = str(audio.tags[tag][0])
-                    break
-            
-            # Try different tag formats for artist
-            for tag in ['TPE1', 'ARTIST', 'Artist', 'artist']:
-                if tag in audio.tags:
-                    artist = str(audio.tags[tag][0])
-                    break
-            
-            # Try different tag formats for date/year
-            for tag in ['TDRC', 'DATE', 'Date', 'date', 'YEAR', 'Year', 'year']:
-                if tag in audio.tags:
-                    date = str(audio.tags[tag][0])
-                    break
-            
-            # Update the UI fields if they're empty
-            if not self.song_name_edit.text() and title:
-                self.song_name_edit.setText(title)
+            # Tags are only read while a field they fill is still empty
+            if not (self.song_name_edit.text() and self.song_artist_edit.text() and self.song_year_edit.text()):
+                # The length probe below doesn't need the tags, so a broken tag must not stop it
+                try:
+                    tags = read_audio_tags(file_path) or {}
+                except Exception as e:
+                    print(f"Tag read error: {e}")
+                    tags = {}
+                
+                # Extract metadata with fallback for different tag formats
+                title = None
+                artist = None
+                date = None
                 
-            if not self.song_artist_edit.text() and artist:
-                self.song_artist_edit.setText(artist)
+                # Try different tag formats for title
+                for tag in ['TIT2', 'TITLE', 'Title', 'title']:
+                    if tag in tags:
+                        title = str(tags[tag][0])
+                        break
                 
-            if not self.song_year_edit.text() and date:
-                self.song_year_edit.setText(date)
+                # Try different tag formats for artist
+                for tag in ['TPE1', 'ARTIST', 'Artist', 'artist']:
+                    if tag in tags:
+                        artist = str(tags[tag][0])
+                        break
+                
+                # Try different tag formats for date/year
+                for tag in ['TDRC', 'DATE', 'Date', 'date', 'YEAR', 'Year', 'year']:
+                    if tag in tags:
+                        date = str(tags[tag][0])
+                        break
+                
+                # Update the UI fields if they're empty
+                if not self.song_name_edit.text() and title:
+                    self.song_name_edit.setText(title)
+                    
+                if not self.song_artist_edit.text() and artist:
+                    self.song_artist_edit.setText(artist)
+                    
+                if not self.song_year_edit.text() and date:
+                    self.song_year_edit.setText(normalize_year(date))
                 
             if not self.song_length_edit.text():
-                length = audio.info.length
-                minutes = int(length // 60)
-                seconds = int(length % 60)
-                self.song_length_edit.setText(f"{minutes}:{seconds:02d}")
+                length = probe_duration(file_path)
+                if length is not None:
+                    self.song_length_edit.setText(format_length(length))
                 
         except Exception as e:
             # If metadata extraction fails, just continue silently
             print(f"Metadata extraction error: {e}")
             
+    def show_analysis(self, result):
+        """Display an audio analysis result, or hide the label when None"""
+        show_analysis_label(self.analysis_label, result)
+            
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -199,6 +857,42 @@ class XMLGenerator(QMainWindow):
         self.process.readyReadStandardError.connect(self.handle_stderr)
         self.process.finished.connect(self.process_finished)
         
+        # Audio analysis state: path -> (file stamp, result)
+        self.analysis_results = {}
+        self.analysis_futures = {}
+        self.analysis_executor = None
+        self.analysis_started = 0.0
+        self.analysis_timer = QTimer(self)
+        self.analysis_timer.timeout.connect(self.poll_analysis)
+        
+        # Background saving: one writer thread, latest snapshot queued per path
+        self.save_thread = None
+        self.pending_saves = {}
+        self.save_errors = {}
+        self.save_callbacks = []
+        
+        # External change detection for current_file
+        self.known_file_stamp = None
+        self.base_snapshot = None  # station as last loaded from or saved to current_file
+        self.load_thread = None
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.on_watched_file_changed)
+        self.file_watcher.directoryChanged.connect(self.on_watched_folder_changed)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.timeout.connect(self.check_external_change)
+        
+        # Exact length measuring for Bulk Edit, same pattern as audio analysis
+        self.length_futures = {}
+        self.length_widgets = []
+        self.length_results = {}
+        self.length_executor = None
+        self.length_timer = QTimer(self)
+        self.length_timer.timeout.connect(self.poll_exact_lengths)
+        
+        # Bulk edit undo history: each entry is one batch of (widget, attr, old, new)
+        self.bulk_undo_stack = []
+        
     def initUI(self):
         self.setWindowTitle('TuneInCrew Radio XML Generator')
         self.setGeometry(100, 100, 1000, 800)
@@ -311,6 +1005,9 @@ class XMLGenerator(QMainWindow):
         
         self.scroll_layout.addWidget(jingles_group)
         
+        # Bulk edit section
+        self.create_bulk_edit_group()
+        
         # Songs section
         songs_group = QGroupBox("Songs")
         songs_layout = QVBoxLayout(songs_group)
@@ -339,6 +1036,10 @@ class XMLGenerator(QMainWindow):
         run_btn.clicked.connect(self.run_tuneincrew)
         button_layout.addWidget(run_btn)
         
+        analyze_btn = QPushButton("Analyze Audio")
+        analyze_btn.clicked.connect(self.analyze_audio)
+        button_layout.addWidget(analyze_btn)
+        
         load_btn = QPushButton("Load XML")
         load_btn.clicked.connect(self.load_xml)
         button_layout.addWidget(load_btn)
@@ -386,6 +1087,67 @@ class XMLGenerator(QMainWindow):
         search_dock.setWidget(search_widget)
         self.addDockWidget(Qt.BottomDockWidgetArea, search_dock)
         
+    def create_bulk_edit_group(self):
+        """Create the controls for editing many selected songs at once"""
+        bulk_group = QGroupBox("Bulk Edit (selected songs)")
+        bulk_layout = QVBoxLayout(bulk_group)
+        
+        selection_layout = QHBoxLayout()
+        select_visible_btn = QPushButton("Select Visible")
+        select_visible_btn.clicked.connect(lambda: self.set_song_selection(True))
+        select_none_btn = QPushButton("Select None")
+        select_none_btn.clicked.connect(lambda: self.set_song_selection(False))
+        self.bulk_undo_btn = QPushButton("Undo Bulk Edit")
+        self.bulk_undo_btn.setEnabled(False)
+        self.bulk_undo_btn.clicked.connect(self.undo_bulk_edit)
+        selection_layout.addWidget(select_visible_btn)
+        selection_layout.addWidget(select_none_btn)
+        selection_layout.addStretch()
+        selection_layout.addWidget(self.bulk_undo_btn)
+        bulk_layout.addLayout(selection_layout)
+        
+        edit_layout = QHBoxLayout()
+        self.bulk_field_combo = QComboBox()
+        for _, attr, label in SONG_FIELDS:
+            self.bulk_field_combo.addItem(label, attr)
+        self.bulk_field_combo.setCurrentIndex(2)  # Artist
+        self.bulk_find_edit = QLineEdit()
+        self.bulk_find_edit.setPlaceholderText("Find")
+        self.bulk_value_edit = QLineEdit()
+        self.bulk_value_edit.setPlaceholderText("Value / replacement")
+        self.bulk_regex_check = QCheckBox("Regex")
+        set_btn = QPushButton("Set Field")
+        set_btn.clicked.connect(self.bulk_set_field)
+        replace_btn = QPushButton("Find/Replace")
+        replace_btn.clicked.connect(self.bulk_find_replace)
+        edit_layout.addWidget(QLabel("Field:"))
+        edit_layout.addWidget(self.bulk_field_combo)
+        edit_layout.addWidget(self.bulk_find_edit)
+        edit_layout.addWidget(self.bulk_value_edit)
+        edit_layout.addWidget(self.bulk_regex_check)
+        edit_layout.addWidget(set_btn)
+        edit_layout.addWidget(replace_btn)
+        bulk_layout.addLayout(edit_layout)
+        
+        format_layout = QHBoxLayout()
+        year_btn = QPushButton("Normalize Year")
+        year_btn.clicked.connect(lambda: self.apply_bulk_edit('song_year_edit', lambda values: [normalize_year(v) for v in values]))
+        length_btn = QPushButton("Normalize Length")
+        length_btn.clicked.connect(lambda: self.apply_bulk_edit('song_length_edit', lambda values: [normalize_length(v) for v in values]))
+        exact_length_btn = QPushButton("Exact Length")
+        exact_length_btn.setToolTip("Re-measure Length from the audio instead of the file headers (slower)")
+        exact_length_btn.clicked.connect(self.bulk_exact_length)
+        renumber_btn = QPushButton("Renumber Force")
+        renumber_btn.setToolTip("Number force sequentially, starting at the value box (default 0)")
+        renumber_btn.clicked.connect(self.bulk_renumber_force)
+        format_layout.addWidget(year_btn)
+        format_layout.addWidget(length_btn)
+        format_layout.addWidget(exact_length_btn)
+        format_layout.addWidget(renumber_btn)
+        bulk_layout.addLayout(format_layout)
+        
+        self.scroll_layout.addWidget(bulk_group)
+        
     def clear_search(self):
         """Clear the search box and show all songs"""
         self.search_edit.clear()
@@ -443,6 +1205,11 @@ class XMLGenerator(QMainWindow):
         jingle_layout.addWidget(jingle_browse_btn)
         jingle_layout.addWidget(remove_btn)
         
+        jingle_widget.analysis_label = QLabel()
+        jingle_widget.analysis_label.setVisible(False)
+        jingle_layout.addWidget(jingle_widget.analysis_label)
+        jingle_file_edit.textChanged.connect(lambda: show_analysis_label(jingle_widget.analysis_label, None))
+        
         self.jingles_layout.addWidget(jingle_widget)
         
     def remove_jingle(self, jingle_widget):
@@ -455,6 +1222,163 @@ class XMLGenerator(QMainWindow):
         self.songs_layout.addWidget(song_widget)
         self.update_song_data(song_widget)
         
+    def song_widgets(self):
+        """Return all song widgets in display order"""
+        widgets = []
+        for i in range(self.songs_layout.count()):
+            song_widget = self.songs_layout.itemAt(i).widget()
+            if song_widget:
+                widgets.append(song_widget)
+        return widgets
+        
+    def set_song_selection(self, selected):
+        """Select all visible songs, or clear the selection"""
+        for song_widget in self.song_widgets():
+            song_widget.select_check.setChecked(selected and not song_widget.isHidden())
+            
+    def selected_songs(self):
+        return [w for w in self.song_widgets() if w.select_check.isChecked()]
+        
+    def apply_bulk_edit(self, attr, compute, widgets=None):
+        """Apply compute(old values) -> new values to one field of the selected songs
+        (or of the given widgets).
+        
+        The whole batch is written with signals and repaints suspended, the search
+        data is refreshed once per song and the batch becomes a single undo step.
+        """
+        if widgets is None:
+            widgets = self.selected_songs()
+        if not widgets:
+            self.statusBar().showMessage("No songs selected", 5000)
+            return
+            
+        old_values = [getattr(w, attr).text() for w in widgets]
+        try:
+            new_values = compute(old_values)
+        except (re.error, ValueError) as e:
+            QMessageBox.warning(self, "Bulk Edit", f"Invalid bulk edit: {str(e)}")
+            return
+            
+        changes = [(w, attr, old, new) for w, old, new in zip(widgets, old_values, new_values) if old != new]
+        if not changes:
+            self.statusBar().showMessage("Bulk edit: nothing to change", 5000)
+            return
+            
+        self.write_bulk_values([(w, attr, new) for w, attr, _, new in changes])
+        self.bulk_undo_stack.append(changes)
+        self.bulk_undo_btn.setEnabled(True)
+        self.statusBar().showMessage(f"Bulk edit: changed {len(changes)} song(s)", 5000)
+        
+    def write_bulk_values(self, values):
+        """Write (widget, attr, text) triples without per-field signal handling.
+        Returns the number of songs actually written."""
+        self.songs_widget.setUpdatesEnabled(False)
+        try:
+            touched = []
+            for song_widget, attr, text in values:
+                try:
+                    edit = getattr(song_widget, attr)
+                    edit.blockSignals(True)
+                    edit.setText(text)
+                    edit.blockSignals(False)
+                    if attr == 'song_file_edit':
+                        # on_file_changed is skipped, so drop the old file's analysis here
+                        song_widget.show_analysis(None)
+                except RuntimeError:
+                    continue  # Song was removed since the edit
+                touched.append(song_widget)
+            touched = list(dict.fromkeys(touched))
+            for song_widget in touched:
+                self.update_song_data(song_widget)
+        finally:
+            self.songs_widget.setUpdatesEnabled(True)
+        if self.search_edit.text():
+            self.search_songs()
+        return len(touched)
+            
+    def undo_bulk_edit(self):
+        if not self.bulk_undo_stack:
+            return
+        changes = self.bulk_undo_stack.pop()
+        restored = self.write_bulk_values([(w, attr, old) for w, attr, old, _ in changes])
+        self.bulk_undo_btn.setEnabled(bool(self.bulk_undo_stack))
+        self.statusBar().showMessage(f"Bulk edit undone for {restored} song(s)", 5000)
+        
+    def clear_bulk_undo(self):
+        """Forget bulk edit history once songs were replaced from elsewhere"""
+        self.bulk_undo_stack.clear()
+        self.bulk_undo_btn.setEnabled(False)
+        
+    def bulk_set_field(self):
+        value = self.bulk_value_edit.text()
+        self.apply_bulk_edit(self.bulk_field_combo.currentData(), lambda values: [value] * len(values))
+        
+    def bulk_find_replace(self):
+        find = self.bulk_find_edit.text()
+        if not find:
+            self.statusBar().showMessage("Bulk edit: enter text to find", 5000)
+            return
+        replacement = self.bulk_value_edit.text()
+        if self.bulk_regex_check.isChecked():
+            def compute(values):
+                regex = re.compile(find)
+                return [regex.sub(replacement, v) for v in values]
+        else:
+            def compute(values):
+                return [v.replace(find, replacement) for v in values]
+        self.apply_bulk_edit(self.bulk_field_combo.currentData(), compute)
+        
+    def bulk_exact_length(self):
+        """Measure exact lengths of the selected songs in a background process pool"""
+        if self.length_futures:
+            self.statusBar().showMessage("Exact lengths are already being measured...")
+            return
+        widgets = [w for w in self.selected_songs() if os.path.exists(w.song_file_edit.text())]
+        if not widgets:
+            self.statusBar().showMessage("No selected songs with an existing file", 5000)
+            return
+            
+        self.length_widgets = widgets
+        self.length_results = {}
+        self.length_executor = ProcessPoolExecutor()
+        for song_widget in widgets:
+            future = self.length_executor.submit(probe_duration, song_widget.song_file_edit.text(), True)
+            self.length_futures[future] = song_widget
+        self.statusBar().showMessage(f"Measuring exact length of {len(widgets)} song(s)...")
+        self.length_timer.start(100)
+        
+    def poll_exact_lengths(self):
+        """Collect finished exact length jobs and apply them as one bulk edit"""
+        for future in [future for future in self.length_futures if future.done()]:
+            song_widget = self.length_futures.pop(future)
+            try:
+                self.length_results[song_widget] = future.result()
+            except Exception:
+                self.length_results[song_widget] = None
+        if self.length_futures:
+            self.statusBar().showMessage(f"Measuring exact lengths... {len(self.length_futures)} song(s) left")
+            return
+            
+        self.length_timer.stop()
+        self.length_executor.shutdown(wait=False)
+        self.length_executor = None
+        
+        # Songs removed while measuring are skipped
+        alive = set(self.song_widgets())
+        widgets = [w for w in self.length_widgets if w in alive]
+        self.length_widgets = []
+        lengths = [self.length_results.get(w) for w in widgets]
+        def compute(values):
+            return [format_length(length) if length is not None else old for length, old in zip(lengths, values)]
+        self.apply_bulk_edit('song_length_edit', compute, widgets)
+        
+    def bulk_renumber_force(self):
+        start_text = self.bulk_value_edit.text().strip() or "0"
+        def compute(values):
+            start = int(start_text)
+            return [str(start + i) for i in range(len(values))]
+        self.apply_bulk_edit('song_force_edit', compute)
+        
     def update_song_data(self, song_widget):
         """Update the searchable data for a song widget"""
         song_name = song_widget.song_name_edit.text()
@@ -495,6 +1419,95 @@ class XMLGenerator(QMainWindow):
         """Handle audio files dropped on line edits"""
         line_edit.setText(file_path)
         
+    def audio_widgets(self):
+        """Yield (file path, widget) for every jingle and song with a file set"""
+        for i in range(self.jingles_layout.count()):
+            jingle_widget = self.jingles_layout.itemAt(i).widget()
+            file_edit = jingle_widget.findChild(QLineEdit) if jingle_widget else None
+            if file_edit and file_edit.text():
+                yield file_edit.text(), jingle_widget
+        for i in range(self.songs_layout.count()):
+            song_widget = self.songs_layout.itemAt(i).widget()
+            if song_widget and song_widget.song_file_edit.text():
+                yield song_widget.song_file_edit.text(), song_widget
+                
+    def cached_analysis(self, file_path):
+        """Return the analysis result for file_path if it is still up to date"""
+        cached = self.analysis_results.get(file_path)
+        if cached is None:
+            return None
+        try:
+            if cached[0] != file_stamp(file_path):
+                return None
+        except OSError:
+            return None
+        return cached[1]
+        
+    def analyze_audio(self):
+        """Analyze all WAV songs and jingles in a background process pool"""
+        if self.analysis_futures:
+            self.statusBar().showMessage("Audio analysis already running...")
+            return
+            
+        pending = set()
+        for file_path, _ in self.audio_widgets():
+            if file_path.lower().endswith('.wav') and os.path.exists(file_path):
+                if self.cached_analysis(file_path) is None:
+                    pending.add(file_path)
+                    
+        if not pending:
+            self.show_analysis_results()
+            self.statusBar().showMessage("Audio analysis is up to date", 5000)
+            return
+            
+        self.analysis_executor = ProcessPoolExecutor()
+        self.analysis_started = time.perf_counter()
+        for file_path in pending:
+            future = self.analysis_executor.submit(analyze_wav, file_path)
+            self.analysis_futures[future] = (file_path, file_stamp(file_path))
+        self.statusBar().showMessage(f"Analyzing {len(pending)} WAV file(s)...")
+        self.analysis_timer.start(100)
+        
+    def poll_analysis(self):
+        """Collect finished analysis jobs without blocking the GUI thread"""
+        done = [future for future in self.analysis_futures if future.done()]
+        for future in done:
+            file_path, stamp = self.analysis_futures.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'error': str(e)}
+            self.analysis_results[file_path] = (stamp, result)
+            
+        if done:
+            self.show_analysis_results()
+            
+        if self.analysis_futures:
+            self.statusBar().showMessage(f"Analyzing audio... {len(self.analysis_futures)} file(s) left")
+        else:
+            self.analysis_timer.stop()
+            self.analysis_executor.shutdown(wait=False)
+            self.analysis_executor = None
+            elapsed = time.perf_counter() - self.analysis_started
+            issues = len(self.collect_analysis_issues())
+            self.statusBar().showMessage(f"Audio analysis finished in {elapsed:.1f}s, {issues} file(s) with issues", 10000)
+            
+    def show_analysis_results(self):
+        """Show cached analysis results next to each jingle and song"""
+        for file_path, widget in self.audio_widgets():
+            show_analysis_label(widget.analysis_label, self.cached_analysis(file_path))
+            
+    def collect_analysis_issues(self):
+        """Return "file: problems" lines for analyzed files that fail the checks"""
+        issues = []
+        for file_path, _ in self.audio_widgets():
+            result = self.cached_analysis(file_path)
+            if result is not None:
+                problems = analysis_issues(result)
+                if problems:
+                    issues.append(f"{os.path.basename(file_path)}: {', '.join(problems)}")
+        return issues
+        
     def run_tuneincrew(self):
         # Check if we have a valid TuneInCrew path
         if not self.tuneincrew_path or not os.path.exists(self.tuneincrew_path):
@@ -502,6 +1515,20 @@ class XMLGenerator(QMainWindow):
             self.browse_tuneincrew()
             return
             
+        # Refuse to build silently when analyzed audio has problems
+        issues = self.collect_analysis_issues()
+        if issues:
+            shown = "\n".join(issues[:20])
+            if len(issues) > 20:
+                shown += f"\n... and {len(issues) - 20} more"
+            reply = QMessageBox.question(
+                self, "Audio Issues",
+                f"The following files have audio issues:\n\n{shown}\n\nRun TuneInCrew anyway?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+            
         # First save the XML to a temporary file if not saved yet
         if not self.current_file:
             temp_file = os.path.join(os.getcwd(), "temp_radio.xml")
@@ -510,6 +1537,14 @@ class XMLGenerator(QMainWindow):
         else:
             xml_path = self.current_file
             
+        # Start only once pending saves have reached the disk
+        self.when_saved(lambda errors: self.start_tuneincrew(xml_path, errors))
+        
+    def start_tuneincrew(self, xml_path, save_errors):
+        if xml_path in save_errors:
+            self.statusBar().showMessage(f"Not running TuneInCrew, saving {xml_path} failed: {save_errors[xml_path]}")
+            return
+            
         # Run TuneInCrew with the XML file
         try:
             # Change to the directory where TuneInCrew is located
@@ -519,7 +1554,7 @@ class XMLGenerator(QMainWindow):
             # Run the process with the XML file as argument
             self.process.start(self.tuneincrew_path, [xml_path])
             
-            QMessageBox.information(self, "Info", f"Running TuneInCrew with: {xml_path}")
+            self.statusBar().showMessage(f"Running TuneInCrew with: {xml_path}")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to run TuneInCrew: {str(e)}")
@@ -549,6 +1584,7 @@ class XMLGenerator(QMainWindow):
                 # Clear existing jingles and songs
                 self.clear_layout(self.jingles_layout)
                 self.clear_layout(self.songs_layout)
+                self.clear_bulk_undo()
                 
                 # Load FMOD path
                 fmod_elem = root.find('fmod')
@@ -612,10 +1648,225 @@ class XMLGenerator(QMainWindow):
                 
                 self.current_file = file_path
                 self.setWindowTitle(f'TuneInCrew Radio XML Generator - {file_path}')
+                self.known_file_stamp = file_stamp(file_path)
+                self.base_snapshot = read_station_xml(file_path)
+                self.watch_current_file()
                 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load XML: {str(e)}")
                 
+    def watch_current_file(self):
+        """Point the file watcher at current_file and its folder.
+        
+        The watcher drops a file once it is removed or atomically replaced, so the folder
+        is watched too and the file is re-added as soon as it exists again.
+        """
+        wanted = []
+        if self.current_file:
+            folder = os.path.dirname(self.current_file) or os.curdir
+            if os.path.isdir(folder):
+                wanted.append(folder)
+            if os.path.exists(self.current_file):
+                wanted.append(self.current_file)
+        watched = self.file_watcher.files() + self.file_watcher.directories()
+        stale = [path for path in watched if path not in wanted]
+        if stale:
+            self.file_watcher.removePaths(stale)
+        missing = [path for path in wanted if path not in watched]
+        if missing:
+            self.file_watcher.addPaths(missing)
+            
+    def on_watched_file_changed(self, path):
+        # Editors often write in several steps, so wait for the file to settle
+        if path == self.current_file:
+            self.reload_timer.start(300)
+            
+    def on_watched_folder_changed(self, path):
+        # Catches current_file reappearing after a delete-and-rewrite or a branch switch;
+        # unrelated changes in the folder end at the stamp comparison
+        if self.current_file:
+            self.reload_timer.start(300)
+            
+    def check_external_change(self):
+        """Reload current_file in the background if someone else changed it"""
+        if not self.current_file:
+            return
+        self.watch_current_file()
+        
+        # Our own pending writes are not external changes
+        if self.save_thread is not None or self.current_file in self.pending_saves or self.load_thread is not None:
+            self.reload_timer.start(300)
+            return
+            
+        try:
+            stamp = file_stamp(self.current_file)
+        except OSError:
+            return  # Removed or mid-replace; the folder watch fires again when it is back
+        if stamp == self.known_file_stamp:
+            return
+            
+        self.statusBar().showMessage(f"Reloading {self.current_file} (changed on disk)...")
+        self.load_thread = LoadThread(self.current_file, stamp, self)
+        self.load_thread.finished.connect(self.external_load_finished)
+        self.load_thread.start()
+        
+    def external_load_finished(self):
+        thread = self.load_thread
+        thread.deleteLater()
+        try:
+            if thread.file_path != self.current_file:
+                return
+            if thread.error:
+                self.statusBar().showMessage(f"Failed to reload XML: {thread.error}")
+                return
+            self.known_file_stamp = thread.stamp
+            self.apply_external_station(thread.snapshot)
+        finally:
+            # Cleared last so no second reload starts while a conflict prompt is open
+            self.load_thread = None
+        
+    def current_jingles(self):
+        """File paths of all jingles that have one, in display order"""
+        jingles = []
+        for i in range(self.jingles_layout.count()):
+            file_edit = self.jingles_layout.itemAt(i).widget().findChild(QLineEdit)
+            if file_edit and file_edit.text():
+                jingles.append(file_edit.text())
+        return tuple(jingles)
+        
+    def apply_external_station(self, snapshot):
+        """Merge the version on disk into the widgets.
+        
+        Changes are worked out against base_snapshot (the last load or save), so rows the
+        user has not touched since are updated quietly, unsaved rows (including songs
+        hidden by the search filter) are left alone, and local edits that the disk
+        version would overwrite are only replaced after asking.
+        """
+        base = self.base_snapshot or StationSnapshot('', '', '', '', (), ())
+        clean = []  # changes that don't touch unsaved local work
+        conflicting = []
+        conflicts = []
+        
+        # Radio settings
+        for field, edit in (('fmod', self.fmod_path_edit), ('id', self.id_edit),
+                            ('name', self.name_edit), ('logo', self.logo_edit)):
+            value = getattr(snapshot, field)
+            if value == getattr(base, field) or edit.text() == value:
+                continue
+            if edit.text() == getattr(base, field):
+                clean.append(('text', edit, value))
+            else:
+                conflicting.append(('text', edit, value))
+                conflicts.append(f"Radio {field}")
+                
+        # Jingles are few, so rebuild them only when the list changed
+        jingles = self.current_jingles()
+        if snapshot.jingles != base.jingles and jingles != snapshot.jingles:
+            if jingles == base.jingles:
+                clean.append(('jingles', snapshot.jingles))
+            else:
+                conflicting.append(('jingles', snapshot.jingles))
+                conflicts.append("Jingles")
+                
+        # Songs, keyed by file path; rows without a file are local drafts and left alone
+        widgets = [w for w in self.song_widgets() if w.song_file_edit.text()]
+        local_songs = [tuple(getattr(w, attr).text() for _, attr, _ in SONG_FIELDS) for w in widgets]
+        base_to_local = match_songs(base.songs, local_songs)
+        added, removed, modified = diff_songs(base.songs, snapshot.songs)
+        
+        for base_index, song in modified:
+            local_index = base_to_local[base_index]
+            if local_index is None:
+                # Removed here but changed on disk
+                conflicting.append(('add', song))
+                conflicts.append(os.path.basename(song[0]))
+            elif local_songs[local_index] == song:
+                continue
+            elif local_songs[local_index] == base.songs[base_index]:
+                clean.append(('update', widgets[local_index], song))
+            else:
+                conflicting.append(('update', widgets[local_index], song))
+                conflicts.append(os.path.basename(song[0]))
+                
+        for base_index in removed:
+            local_index = base_to_local[base_index]
+            if local_index is None:
+                continue  # Removed in both
+            if local_songs[local_index] == base.songs[base_index]:
+                clean.append(('remove', widgets[local_index]))
+            else:
+                conflicting.append(('remove', widgets[local_index]))
+                conflicts.append(os.path.basename(local_songs[local_index][0]))
+                
+        # Songs new on disk may collide with unsaved local rows for the same file
+        claimed = set(index for index in base_to_local if index is not None)
+        unsaved = [index for index in range(len(local_songs)) if index not in claimed]
+        for song, match in zip(added, match_songs(added, [local_songs[i] for i in unsaved])):
+            if match is None:
+                clean.append(('add', song))
+            elif local_songs[unsaved[match]] != song:
+                conflicting.append(('update', widgets[unsaved[match]], song))
+                conflicts.append(os.path.basename(song[0]))
+                
+        kept = 0
+        if conflicting:
+            shown = "\n".join(conflicts[:20])
+            if len(conflicts) > 20:
+                shown += f"\n... and {len(conflicts) - 20} more"
+            reply = QMessageBox.question(
+                self, "File Changed on Disk",
+                f"{self.current_file} was changed by another program, and these have unsaved "
+                f"changes here:\n\n{shown}\n\nReplace them with the version on disk?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                clean.extend(conflicting)
+            else:
+                kept = len(conflicting)
+                
+        # Undoing an older bulk edit would silently drop what came from disk
+        if any(change[0] in ('update', 'remove', 'add') for change in clean):
+            self.clear_bulk_undo()
+        self.apply_station_changes(clean)
+        self.base_snapshot = snapshot
+        
+        message = f"Reloaded external changes: {len(clean)} applied"
+        if kept:
+            message += f", kept {kept} local change(s)"
+        self.statusBar().showMessage(message, 10000)
+        
+    def apply_station_changes(self, changes):
+        """Apply ('text' | 'jingles' | 'update' | 'remove' | 'add', ...) changes in one pass"""
+        values = []
+        self.songs_widget.setUpdatesEnabled(False)
+        try:
+            for change in changes:
+                kind = change[0]
+                if kind == 'text':
+                    change[1].setText(change[2])
+                elif kind == 'jingles':
+                    self.clear_layout(self.jingles_layout)
+                    for jingle in change[1]:
+                        self.add_jingle()
+                        last_jingle = self.jingles_layout.itemAt(self.jingles_layout.count() - 1).widget()
+                        last_jingle.findChild(QLineEdit).setText(jingle)
+                elif kind == 'update':
+                    song_widget, song = change[1], change[2]
+                    for (_, attr, _), value in zip(SONG_FIELDS, song):
+                        if getattr(song_widget, attr).text() != value:
+                            values.append((song_widget, attr, value))
+                elif kind == 'remove':
+                    self.remove_song(change[1])
+                elif kind == 'add':
+                    self.add_song()
+                    last_song = self.songs_layout.itemAt(self.songs_layout.count() - 1).widget()
+                    values.extend((last_song, attr, value) for (_, attr, _), value in zip(SONG_FIELDS, change[1]))
+        finally:
+            self.songs_widget.setUpdatesEnabled(True)
+            
+        # Written with signals blocked, so no metadata is re-extracted
+        self.write_bulk_values(values)
+        
     def clear_layout(self, layout):
         while layout.count():
             child = layout.takeAt(0)
@@ -637,112 +1888,111 @@ class XMLGenerator(QMainWindow):
             self.current_file = file_path
             self.setWindowTitle(f'TuneInCrew Radio XML Generator - {file_path}')
             
+    def station_snapshot(self):
+        """Copy the current station out of the widgets into a StationSnapshot"""
+        songs = []
+        for song_widget in self.song_widgets():
+            # Only include visible songs (not filtered out by search) with a file path set
+            if song_widget.isVisible() and song_widget.song_file_edit.text():
+                songs.append(tuple(getattr(song_widget, attr).text() for _, attr, _ in SONG_FIELDS))
+                
+        return StationSnapshot(
+            fmod=self.fmod_path_edit.text(),
+            id=self.id_edit.text(),
+            name=self.name_edit.text(),
+            logo=self.logo_edit.text(),
+            jingles=self.current_jingles(),
+            songs=tuple(songs),
+        )
+        
     def generate_xml(self, file_path):
+        """Queue a snapshot of the station to be written in the background"""
         try:
-            # Create root element
-            root = ET.Element("project")
-            
-            # Add FMOD path
-            fmod_elem = ET.SubElement(root, "fmod")
-            fmod_elem.text = self.escape_xml_text(self.fmod_path_edit.text())
-            
-            # Add radio element
-            radio_elem = ET.SubElement(root, "radio")
-            
-            # Add radio ID
-            id_elem = ET.SubElement(radio_elem, "id")
-            id_elem.text = self.escape_xml_text(self.id_edit.text())
-            
-            # Add radio name
-            name_elem = ET.SubElement(radio_elem, "name")
-            name_elem.text = self.escape_xml_text(self.name_edit.text())
-            
-            # Add radio logo
-            logo_elem = ET.SubElement(radio_elem, "logo")
-            logo_elem.text = self.escape_xml_text(self.logo_edit.text())
-            
-            # Add jingles if any
-            jingles_added = False
-            for i in range(self.jingles_layout.count()):
-                jingle_widget = self.jingles_layout.itemAt(i).widget()
-                file_edit = jingle_widget.findChild(QLineEdit)
-                if file_edit and file_edit.text():
-                    if not jingles_added:
-                        jingles_elem = ET.SubElement(radio_elem, "jingles")
-                        jingles_added = True
-                    file_elem = ET.SubElement(jingles_elem, "file")
-                    file_elem.text = self.escape_xml_text(file_edit.text())
-            
-            # Add songs
-            songs_elem = ET.SubElement(radio_elem, "songs")
-            for i in range(self.songs_layout.count()):
-                song_widget = self.songs_layout.itemAt(i).widget()
-                if song_widget.isVisible():  # Only include visible songs (not filtered out by search)
-                    if song_widget.song_file_edit.text():  # Check if file path is set
-                        song_elem = ET.SubElement(songs_elem, "song")
-                        
-                        file_elem = ET.SubElement(song_elem, "file")
-                        file_elem.text = self.escape_xml_text(song_widget.song_file_edit.text())
-                        
-                        name_elem = ET.SubElement(song_elem, "name")
-                        name_elem.text = self.escape_xml_text(song_widget.song_name_edit.text())
-                        
-                        artist_elem = ET.SubElement(song_elem, "artist")
-                        artist_elem.text = self.escape_xml_text(song_widget.song_artist_edit.text())
-                        
-                        year_elem = ET.SubElement(song_elem, "year")
-                        year_elem.text = self.escape_xml_text(song_widget.song_year_edit.text())
-                        
-                        length_elem = ET.SubElement(song_elem, "length")
-                        length_elem.text = self.escape_xml_text(song_widget.song_length_edit.text())
-                        
-                        force_elem = ET.SubElement(song_elem, "force")
-                        force_elem.text = self.escape_xml_text(song_widget.song_force_edit.text())
-            
-            # Create XML tree and write to file with formatting
-            tree = ET.ElementTree(root)
-            
-            # Add XML declaration with pretty formatting
-            with open(file_path, 'wb') as f:
-                f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-                self.pretty_write(f, root, 0)
-            
-            QMessageBox.information(self, "Success", "XML file saved successfully!")
-            
+            snapshot = self.station_snapshot()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save XML: {str(e)}")
-    
-    def escape_xml_text(self, text):
-        """Escape special XML characters"""
-        if not text:
-            return text
-            
-        # Replace special characters with their XML entities
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&apos;")
+            self.statusBar().showMessage(f"Failed to save XML: {str(e)}")
+            return
+            
+        # A newer snapshot for the same file replaces any that has not started yet
+        self.pending_saves.pop(file_path, None)
+        self.pending_saves[file_path] = snapshot
+        self.start_next_save()
         
-        return text
-    
-    def pretty_write(self, file, elem, level=0):
-        """Recursively write XML with proper indentation"""
-        indent = "  " * level
-        if len(elem) == 0:  # No children
-            if elem.text and elem.text.strip():
-                file.write(f"{indent}<{elem.tag}>{elem.text}</{elem.tag}>\n".encode('utf-8'))
-            else:
-                file.write(f"{indent}<{elem.tag}></{elem.tag}>\n".encode('utf-8'))
+    def start_next_save(self):
+        if self.save_thread is not None:
+            return
+        if not self.pending_saves:
+            self.run_save_callbacks()
+            return
+            
+        file_path = next(iter(self.pending_saves))
+        snapshot = self.pending_saves.pop(file_path)
+        self.statusBar().showMessage(f"Saving {file_path}...")
+        self.save_thread = SaveThread(file_path, snapshot, self)
+        self.save_thread.finished.connect(self.save_finished)
+        self.save_thread.start()
+        
+    def save_finished(self):
+        thread = self.save_thread
+        self.save_thread = None
+        thread.deleteLater()
+        
+        if thread.error:
+            self.save_errors[thread.file_path] = thread.error
+            self.statusBar().showMessage(f"Failed to save XML: {thread.error}")
         else:
-            file.write(f"{indent}<{elem.tag}>\n".encode('utf-8'))
-            if elem.text and elem.text.strip():
-                file.write(f"{indent}  {elem.text}\n".encode('utf-8'))
+            self.save_errors.pop(thread.file_path, None)
+            if thread.file_path == self.current_file:
+                # Remember our own write so the watcher does not reload it
+                self.base_snapshot = thread.snapshot
+                try:
+                    self.known_file_stamp = file_stamp(thread.file_path)
+                except OSError:
+                    pass  # Already removed or replaced; the watcher handles it
+                self.watch_current_file()
+            if thread.file_path not in self.pending_saves:
+                self.statusBar().showMessage(f"Saved {thread.file_path}", 5000)
+        self.start_next_save()
+        
+    def when_saved(self, callback):
+        """Call callback(save errors by path) once no save is pending or running"""
+        self.save_callbacks.append(callback)
+        if self.save_thread is None and not self.pending_saves:
+            self.run_save_callbacks()
             
-            for child in elem:
-                self.pretty_write(file, child, level + 1)
-                
-            file.write(f"{indent}</{elem.tag}>\n".encode('utf-8'))
+    def run_save_callbacks(self):
+        callbacks, self.save_callbacks = self.save_callbacks, []
+        for callback in callbacks:
+            callback(dict(self.save_errors))
+            
+    def closeEvent(self, event):
+        # Drop queued analysis and length jobs, otherwise interpreter exit waits for all of them
+        self.analysis_timer.stop()
+        if self.analysis_executor is not None:
+            self.analysis_executor.shutdown(wait=False, cancel_futures=True)
+            self.analysis_executor = None
+        self.analysis_futures.clear()
+        self.length_timer.stop()
+        if self.length_executor is not None:
+            self.length_executor.shutdown(wait=False, cancel_futures=True)
+            self.length_executor = None
+        self.length_futures.clear()
+        
+        # A running reload thread must finish before the window that owns it goes away
+        self.reload_timer.stop()
+        if self.load_thread is not None:
+            self.load_thread.wait()
+        
+        # Finish writing queued saves so closing never loses the last one
+        if self.save_thread is not None:
+            self.save_thread.wait()
+        for file_path, snapshot in self.pending_saves.items():
+            try:
+                write_station_xml(file_path, snapshot)
+            except Exception as e:
+                print(f"Failed to save XML: {e}")
+        self.pending_saves.clear()
+        super().closeEvent(event)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)